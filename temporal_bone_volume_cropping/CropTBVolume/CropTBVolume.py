@@ -1,6 +1,10 @@
 # Standard library imports
 import logging
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from typing import Any, Dict, Optional, Tuple, Union, Annotated
 
 # Third-party imports
@@ -26,8 +30,43 @@ from qt import QPushButton, QTimer, QMessageBox
 import qt
 
 RENAMED_EVENT = vtk.vtkCommand.UserEvent + 1  # Typically vtkCommand.UserEvent + 1 is used for renamed events
+VOLUME_INFO_FORMAT = "%s: %dx%dx%d (%.2fx%.2fx%.2f mm)"  # label prefix, dims, spacing
+CROPPED_NAME_RE = re.compile(r"^Cropped_(.+?)_(\d+)$")  # Auto-generated output names: base name, number
+ROI_NAME_RE = re.compile(r"^CropROI_(\d+)$")  # ROIs created from a point: number
+CACHED_NODE_CLASSES = ("vtkMRMLScalarVolumeNode", "vtkMRMLMarkupsROINode")  # Classes scanned for unique names
 DEFAULT_ROI_SIZE = [51.2, 51.2, 51.2] # mm
 ROI_LOCKED = True # Default state
+PLACEMENT_OBSERVER_PRIORITY = 1.0  # Point placement handlers run before the default interaction
+PARALLEL_COPY_MIN_BYTES = 16 * 1024 * 1024  # Smaller crops are copied on one thread
+GEOMETRY_CACHE_SIZE = 4  # Volumes whose IJK/RAS matrices are kept by the logic
+# Indices into [xmin, xmax, ymin, ymax, zmin, zmax] selecting the 8 box corners
+CORNER_IDX = np.array([[x, y, z] for x in (0, 1) for y in (2, 3) for z in (4, 5)])
+
+
+@contextmanager
+def blockedSignals(*widgets):
+    """Block Qt signals of the widgets for the duration of the with block"""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, wasBlocked in zip(widgets, previous):
+            widget.blockSignals(wasBlocked)
+
+
+class ObserverBag:
+    """Track VTK observers added to nodes so they can all be removed at once"""
+
+    def __init__(self):
+        self._tags = []  # (object, observer tag) pairs
+
+    def add(self, obj, event, callback):
+        self._tags.append((obj, obj.AddObserver(event, callback)))
+
+    def clear(self):
+        for obj, tag in self._tags:
+            obj.RemoveObserver(tag)
+        self._tags.clear()
 
 #
 # CropTBVolumeParameterNode
@@ -59,22 +98,56 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         VTKObservationMixin.__init__(self)
         self.logic = None
         self._parameterNode = None
-        self.roiObservers = []  # Initialize observers list here
+        self._parameterNodeGuiTag = None  # Returned by connectGui, needed to disconnect
+        self._roiObservers = ObserverBag()  # Observers on the selected ROI node
+        self._observedROI = None  # ROI node the _roiObservers are attached to
         self.ui = None  # Initialize ui here
         self._roiUpdateTimer = QTimer()
         self._roiUpdateTimer.setSingleShot(True)
-        self._roiUpdateTimer.timeout.connect(self.updateROISizeWidget)
-        self.inputVolumeObserverTag = None
-        self.outputVolumeObserverTag = None
+        self._roiUpdateTimer.setInterval(80)  # Debounce window for ROI drag events
+        self._roiUpdateTimer.timeout.connect(self.onROIUpdateTimeout)
+        self._roiSizeStale = False  # ROI changed while the size spin boxes were hidden
+        self._updatingROI = False  # True while the spin boxes are pushing a size to the ROI
+        # Applies spin box edits to the ROI once the user stops typing or stepping
+        self._sizeApplyTimer = QTimer()
+        self._sizeApplyTimer.setSingleShot(True)
+        self._sizeApplyTimer.setInterval(50)
+        self._sizeApplyTimer.timeout.connect(self._applyROISize)
+        # Coalesces info label refresh requests from the many selector and scene callbacks
+        self._infoUpdateTimer = QTimer()
+        self._infoUpdateTimer.setSingleShot(True)
+        self._infoUpdateTimer.setInterval(50)
+        self._infoUpdateTimer.timeout.connect(self._doUpdateVolumeInfo)
+        # Coalesces view render requests into at most one per ~16ms frame
+        self._renderTimer = QTimer()
+        self._renderTimer.setSingleShot(True)
+        self._renderTimer.setInterval(16)
+        self._renderTimer.timeout.connect(self._renderAllViews)
+        self._renameObservers = ObserverBag()  # Input/output volume rename observers
+        self._lastRenameHandled = None  # (node ID, name) of the last input rename acted on
         self.roiLocked = ROI_LOCKED # Track ROI Lock state
-        self.tempMarkupNode = None
+        self._placementFiducial = None  # Hidden point list reused for every ROI placement
+        self._lastInfoKey = None  # Volume state shown by the info labels
+        self._lastSaveVolumeID = None  # Output volume last pushed to the save selector
+        self._applyEnabled = None  # Last enabled state set on the Apply button (None = unknown)
+        self._sliceWidgetCache = None  # View name -> slice widget, rebuilt after layout changes
+        self._volumeInfoCache = {}  # Label prefix -> (volume info key, text)
+        self._nodesByClass = {className: {} for className in CACHED_NODE_CLASSES}  # Node ID -> node
+        self._outputNameCounters = {}  # Input base name -> highest Cropped_<base>_<n> number seen
+        self._roiNameCounter = None  # Highest CropROI_<n> number seen (None = not scanned yet)
+        # Reusable buffers for ROI geometry math
+        self._bounds = np.zeros(6)
+        self._center = np.zeros(3)
+        self._size = np.zeros(3)
+        self._layoutManager = None  # Layout manager whose layoutChanged signal is connected
 
     def setup(self) -> None:
         ScriptedLoadableModuleWidget.setup(self)
+        scene = slicer.mrmlScene
         
         # Load UI file
         uiWidget = slicer.util.loadUI(self.resourcePath('UI/CropTBVolume.ui'))
-        uiWidget.setMRMLScene(slicer.mrmlScene)
+        uiWidget.setMRMLScene(scene)
         self.layout.addWidget(uiWidget)
         self.ui = slicer.util.childWidgetVariables(uiWidget)
 
@@ -83,6 +156,19 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if not self.logic:
             raise ValueError("Logic initialization failed")
         
+        # Keep per-class node lookups up to date instead of scanning the scene
+        self.rebuildNodeCache()
+        self.addObserver(scene, scene.NodeAddedEvent, self.onSceneNodeAdded)
+        self.addObserver(scene, scene.NodeRemovedEvent, self.onSceneNodeRemoved)
+        self.addObserver(scene, scene.EndCloseEvent, self.onSceneEndClose)
+        self.addObserver(scene, scene.EndBatchProcessEvent, self.onSceneEndBatchProcess)
+
+        # Slice widgets are looked up once per layout rather than per use
+        layoutManager = slicer.app.layoutManager()
+        if layoutManager:
+            layoutManager.layoutChanged.connect(self._invalidateSliceCache)
+            self._layoutManager = layoutManager
+
         # Initialize parameter node
         self._parameterNode = None
         self.setParameterNode(self.logic.wrappedParameterNode)
@@ -99,9 +185,9 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             self.ui.roiVisibilityButton.toggled.connect(self.onROIVisibilityToggled)
         
         # Set MRML Scene for selectors
-        self.ui.inputSelector.setMRMLScene(slicer.mrmlScene)
-        self.ui.outputSelector.setMRMLScene(slicer.mrmlScene)
-        self.ui.roiSelector.setMRMLScene(slicer.mrmlScene)
+        self.ui.inputSelector.setMRMLScene(scene)
+        self.ui.outputSelector.setMRMLScene(scene)
+        self.ui.roiSelector.setMRMLScene(scene)
         
         # Connect signals
         self.ui.inputSelector.connect("currentNodeChanged(vtkMRMLNode*)", self.updateParameterNode)
@@ -120,7 +206,7 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.roiSelector.connect("currentNodeChanged(vtkMRMLNode*)", self.onROISelectionChanged)
     
         # Configure save volume selector
-        self.ui.saveVolumeSelector.setMRMLScene(slicer.mrmlScene)
+        self.ui.saveVolumeSelector.setMRMLScene(scene)
         self.ui.saveVolumeSelector.setCurrentNode(None)  # Start with no selection
         self.ui.saveVolumeSelector.removeEnabled = False  # Disable the remove button
         self.ui.saveVolumeSelector.noneEnabled = True  # Allow deselecting
@@ -135,6 +221,9 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.roiSelector.addEnabled = False  # Disable the "+" button to create new ROIs
         self.ui.roiSelector.removeEnabled = True  # Keep remove functionality
         
+        # Refresh sizes skipped while the ROI controls section was collapsed
+        self.ui.roiControlsCollapsibleButton.contentsCollapsed.connect(self.onROIControlsCollapsed)
+
         # Connect ROI controls
         self.ui.sizeXSpinBox.connect('valueChanged(double)', self.onROISizeChanged)
         self.ui.sizeYSpinBox.connect('valueChanged(double)', self.onROISizeChanged)
@@ -146,10 +235,8 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.createROIFromPointButton.connect('clicked(bool)', self.onCreateROIFromPoint)
         self.ui.roiLockButton.toggled.connect(self.onROILockToggled)
     
-        # Set initial ROI size to default
-        self.ui.sizeXSpinBox.value = DEFAULT_ROI_SIZE[0]
-        self.ui.sizeYSpinBox.value = DEFAULT_ROI_SIZE[1]
-        self.ui.sizeZSpinBox.value = DEFAULT_ROI_SIZE[2]
+        # Set initial ROI size to default, without three onROISizeChanged calls
+        self._setSizeSpinboxes(*DEFAULT_ROI_SIZE)
         
         # Set initial locked state
         self.setROIControlsEnabled(False)
@@ -159,31 +246,114 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.setControlsEnabled(False)
         self.updateVolumeInfo()
 
+    def enter(self) -> None:
+        """Called each time the user opens this module"""
+        # Widgets skip updates while hidden; refresh them once the module is shown
+        QTimer.singleShot(0, self.refreshHiddenWidgets)
+
+    def refreshHiddenWidgets(self):
+        """Bring the size spin boxes and info labels up to date after being hidden"""
+        if self._roiSizeStale:
+            self._roiSizeStale = False
+            self.updateROISizeWidget()
+        self.updateVolumeInfo()
+
+    def onROIControlsCollapsed(self, collapsed):
+        """Refresh the size spin boxes when their section is expanded"""
+        if not collapsed and self._roiSizeStale:
+            self._roiSizeStale = False
+            self.updateROISizeWidget()
+
+    def onROIUpdateTimeout(self):
+        """Refresh the size spin boxes after a burst of ROI events, unless they are hidden"""
+        if not self.ui.sizeXSpinBox.isVisible():
+            self._roiSizeStale = True
+            return
+        self.updateROISizeWidget()
+
+    def rebuildNodeCache(self):
+        """Populate the per-class node lookups from the current scene"""
+        for className, nodes in self._nodesByClass.items():
+            nodes.clear()
+            for node in slicer.util.getNodesByClass(className):
+                nodes[node.GetID()] = node
+
+    @vtk.calldata_type(vtk.VTK_OBJECT)
+    def onSceneNodeAdded(self, caller, event, node):
+        """Track newly added nodes of the cached classes"""
+        for className, nodes in self._nodesByClass.items():
+            if node.IsA(className):
+                nodes[node.GetID()] = node
+        # Keep output name counters ahead of volumes added with matching names
+        match = CROPPED_NAME_RE.match(node.GetName() or "")
+        if match and match.group(1) in self._outputNameCounters:
+            base_name, number = match.group(1), int(match.group(2))
+            self._outputNameCounters[base_name] = max(self._outputNameCounters[base_name], number)
+        match = ROI_NAME_RE.match(node.GetName() or "")
+        if match and self._roiNameCounter is not None:
+            self._roiNameCounter = max(self._roiNameCounter, int(match.group(1)))
+
+    @vtk.calldata_type(vtk.VTK_OBJECT)
+    def onSceneNodeRemoved(self, caller, event, node):
+        """Forget removed nodes of the cached classes"""
+        for nodes in self._nodesByClass.values():
+            nodes.pop(node.GetID(), None)
+
+    def onSceneEndClose(self, caller, event):
+        """Resynchronize the node lookups after the scene is closed"""
+        self.rebuildNodeCache()
+        self._outputNameCounters.clear()
+        self._roiNameCounter = None
+
+    def onSceneEndBatchProcess(self, caller, event):
+        """Refresh the info labels once the batch that suppressed them has finished"""
+        self.updateVolumeInfo()
+
+    def _isCropping(self) -> bool:
+        """True while the logic copies voxels in the background and Qt events keep running"""
+        return self.logic is not None and self.logic.isCropping
+
+    def _renderAllViews(self) -> None:
+        """Render all views, deferred while a crop may have a half-written output buffer"""
+        if self._isCropping():
+            self._renderTimer.start()
+            return
+        slicer.util.forceRenderAllViews()
+
+    def getSliceWidgets(self):
+        """Return the Red, Yellow and Green slice widgets present in the current layout"""
+        if self._sliceWidgetCache is None:
+            layoutManager = slicer.app.layoutManager()
+            self._sliceWidgetCache = {}
+            for sliceViewName in ['Red', 'Yellow', 'Green']:
+                sliceWidget = layoutManager.sliceWidget(sliceViewName) if layoutManager else None
+                if sliceWidget:
+                    self._sliceWidgetCache[sliceViewName] = sliceWidget
+        return self._sliceWidgetCache.values()
+
+    def _invalidateSliceCache(self, *args):
+        """Forget the cached slice widgets after the view layout changes"""
+        self._sliceWidgetCache = None
+
     def addROIObservers(self):
         """Add observers to current ROI node"""
-        self.removeROIObservers()  # Clean up any existing observers first
-        
         roiNode = self.ui.roiSelector.currentNode()
+        if roiNode is self._observedROI:
+            return  # Already observing this ROI
+
+        self.removeROIObservers()  # Clean up any existing observers first
+        self._observedROI = roiNode
         if roiNode:
-            # Observe ROI modified events
-            tag = roiNode.AddObserver(vtk.vtkCommand.ModifiedEvent, self.onROIModified)
-            self.roiObservers.append((roiNode, tag))
-            
-            # Also observe display node if it exists
-            displayNode = roiNode.GetDisplayNode()
-            if displayNode:
-                tag = displayNode.AddObserver(vtk.vtkCommand.ModifiedEvent, self.onROIModified)
-                self.roiObservers.append((displayNode, tag))
+            # Observe ROI modified events; display node changes never affect the size
+            self._roiObservers.add(roiNode, vtk.vtkCommand.ModifiedEvent, self.onROIModified)
 
     def removeROIObservers(self):
         """Remove all ROI observers"""
-        for caller, tag in self.roiObservers:
-            caller.RemoveObserver(tag)
-        self.roiObservers = []
+        self._roiObservers.clear()
+        self._observedROI = None
 
     def onROISelectionChanged(self, node):
         """Handle ROI node selection changes"""
-        self.removeROIObservers()
         self.addROIObservers()
         self.updateROISizeWidget()
     
@@ -193,7 +363,7 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             # Get selected volume - use output volume if available, otherwise allow any selection
             volumeNode = self.ui.saveVolumeSelector.currentNode()
             if volumeNode is None:
-                if hasattr(self, '_parameterNode') and self._parameterNode and self._parameterNode.outputVolume:
+                if self._parameterNode is not None and self._parameterNode.outputVolume:
                     volumeNode = self._parameterNode.outputVolume
                     self.ui.saveVolumeSelector.setCurrentNode(volumeNode)
                 else:
@@ -217,8 +387,9 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                 return  # User canceled
 
             # Append extension if missing
-            if not fileName.lower().endswith(('.nrrd', '.nii', '.nii.gz')):
-                if "nii" in fileName.lower():
+            lower_name = fileName.lower()
+            if not lower_name.endswith(('.nrrd', '.nii', '.nii.gz')):
+                if "nii" in lower_name:
                     fileName += ".nii"
                 else:
                     fileName += ".nrrd"
@@ -249,19 +420,21 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     
     def updateSaveVolumeSelector(self):
         """Update the save volume selector with current output volume"""
-        if hasattr(self, '_parameterNode') and self._parameterNode and self._parameterNode.outputVolume:
-            self.ui.saveVolumeSelector.setCurrentNode(self._parameterNode.outputVolume)
-        else:
-            self.ui.saveVolumeSelector.setCurrentNode(None)
+        outputVolume = self._parameterNode.outputVolume if self._parameterNode else None
+        newID = outputVolume.GetID() if outputVolume else None
+        if newID == self._lastSaveVolumeID:
+            return  # Output unchanged since the selector was last set
+        self._lastSaveVolumeID = newID
+        self.ui.saveVolumeSelector.setCurrentNode(outputVolume)
         
     def checkApplyButtonEnabled(self):
         """Enable Apply button only when both input volume and ROI are selected"""
         inputNode = self.ui.inputSelector.currentNode()
         roiNode = self.ui.roiSelector.currentNode()
-        if inputNode is not None and roiNode is not None:
-            self.ui.applyButton.setEnabled(True)
-        else:
-            self.ui.applyButton.setEnabled(False)
+        enabled = inputNode is not None and roiNode is not None
+        if enabled != self._applyEnabled:  # Only touch the button when the state flips
+            self.ui.applyButton.setEnabled(enabled)
+            self._applyEnabled = enabled
         
     def setControlsEnabled(self, enabled):
         """Enable/disable all controls except input selector"""
@@ -269,6 +442,7 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.roiSelector.setEnabled(enabled)
         self.ui.fitToVolumeButton.setEnabled(enabled)
         self.ui.applyButton.setEnabled(enabled)
+        self._applyEnabled = enabled
         self.setROIControlsEnabled(enabled and not self.roiLocked)
     
     def setROIControlsEnabled(self, enabled):
@@ -283,7 +457,7 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         
         # Invalidate views if disabling to indicate ROI is locked
         if not enabled:
-            slicer.util.forceRenderAllViews()
+            self._renderTimer.start()
             
     def onCreateROIFromPoint(self):
         """Stable point selection that works across Slicer versions"""
@@ -306,21 +480,8 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if result == QMessageBox.No:
             return
         
-        # Create temporary markup node
-        self.tempMarkupNode = slicer.mrmlScene.AddNewNodeByClass('vtkMRMLMarkupsFiducialNode', 'TempROIPoint')
-        self.tempMarkupNode.CreateDefaultDisplayNodes()
-        displayNode = self.tempMarkupNode.GetDisplayNode()
-        
-        # Version-compatible display settings
-        try:
-            # Slicer 5.0+ style
-            displayNode.SetGlyphType(displayNode.Sphere3D)
-        except:
-            # Fallback for older versions
-            displayNode.SetGlyphTypeFromString('Sphere')
-        displayNode.SetGlyphScale(3.0)
-        displayNode.SetSelectedColor(1,1,0) # Yellow
-        displayNode.SetTextScale(0) # Hide text
+        # Start from an empty placement marker; it is shown once a point is clicked
+        self.getPlacementFiducial().RemoveAllControlPoints()
         
         # Clear any pending mouse events
         slicer.app.processEvents()
@@ -328,24 +489,65 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         # Set up mouse click observers
         self.observerTags = []
         self.sliceWidgets = []
-        layoutManager = slicer.app.layoutManager()
         
         # Observe all slice views
-        for sliceViewName in ['Red', 'Yellow', 'Green']:
-            sliceWidget = layoutManager.sliceWidget(sliceViewName)
+        for sliceWidget in self.getSliceWidgets():
             if sliceWidget:
                 self.sliceWidgets.append(sliceWidget)
                 interactor = sliceWidget.sliceView().interactor()
                 # Observe left mouse clicks
-                tag = interactor.AddObserver(vtk.vtkCommand.LeftButtonPressEvent, self.onSliceClick)
+                tag = interactor.AddObserver(vtk.vtkCommand.LeftButtonPressEvent, self.onSliceClick,
+                                             PLACEMENT_OBSERVER_PRIORITY)
                 self.observerTags.append((interactor, tag))
                 # Observe Escape key
-                tag_esc = interactor.AddObserver(vtk.vtkCommand.KeyPressEvent, self.onKeyPress)
+                tag_esc = interactor.AddObserver(vtk.vtkCommand.KeyPressEvent, self.onKeyPress,
+                                                 PLACEMENT_OBSERVER_PRIORITY)
                 self.observerTags.append((interactor, tag_esc))
 
         # Initialize status message
         slicer.util.showStatusMessage("Click in any slice view to place ROI center. Press Esc to cancel.")
 
+    def getPlacementFiducial(self):
+        """Return the hidden placement marker, creating it if it is not in the scene"""
+        if self._placementFiducial is not None and self._placementFiducial.GetScene() is not None:
+            return self._placementFiducial
+
+        # Created once and then hidden/shown, so placements do not add and remove scene nodes.
+        # It lives as long as the widget, so keep it out of node selectors, the Data module
+        # and subject hierarchy (hidden nodes are not added there when flagged before AddNode)
+        fiducial = slicer.vtkMRMLMarkupsFiducialNode()
+        fiducial.SetName('TempROIPoint')
+        fiducial.SetHideFromEditors(True)
+        fiducial.SetSaveWithScene(False)
+        slicer.mrmlScene.AddNode(fiducial)
+        shNode = slicer.mrmlScene.GetSubjectHierarchyNode()
+        if shNode:
+            itemID = shNode.GetItemByDataNode(fiducial)
+            if itemID:
+                shNode.RemoveItem(itemID, False, False)  # Keep the data node itself
+        self._placementFiducial = fiducial
+        fiducial.CreateDefaultDisplayNodes()
+        displayNode = fiducial.GetDisplayNode()
+        
+        # Version-compatible display settings
+        try:
+            # Slicer 5.0+ style
+            displayNode.SetGlyphType(displayNode.Sphere3D)
+        except AttributeError:
+            # Fallback for older versions
+            displayNode.SetGlyphTypeFromString('Sphere')
+        displayNode.SetGlyphScale(3.0)
+        displayNode.SetSelectedColor(1,1,0) # Yellow
+        displayNode.SetTextScale(0) # Hide text
+        displayNode.SetVisibility(False)
+        return self._placementFiducial
+
+    def hidePlacementFiducial(self):
+        """Hide and clear the placement marker, keeping it for the next placement"""
+        if self._placementFiducial is not None and self._placementFiducial.GetScene() is not None:
+            self._placementFiducial.GetDisplayNode().SetVisibility(False)
+            self._placementFiducial.RemoveAllControlPoints()
+
     def onSliceClick(self, interactor, event):
         """Handle slice view mouse clicks"""
         try:
@@ -360,13 +562,21 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                     xyz = list(sliceView.convertDeviceToXYZ(xy))  # Returns QList<double> [x,y,z]
                     ras = list(sliceView.convertXYZToRAS(xyz))    # Returns QList<double> [R,A,S]
                     
-                    # Add visual feedback
-                    self.tempMarkupNode.RemoveAllControlPoints()
-                    self.tempMarkupNode.AddControlPoint(ras[0], ras[1], ras[2])
+                    # Add visual feedback, as a single modification of the point list
+                    marker = self.getPlacementFiducial()
+                    wasModifying = marker.StartModify()
+                    try:
+                        marker.RemoveAllControlPoints()
+                        marker.AddControlPoint(ras[0], ras[1], ras[2])
+                    finally:
+                        marker.EndModify(wasModifying)
+                    marker.GetDisplayNode().SetVisibility(True)
                     
-                    # Confirm placement after short delay
-                    QTimer.singleShot(100, lambda: self.confirmAndCreateROI(ras))
+                    # Stop listening for clicks, then confirm once this VTK event has been
+                    # dispatched: a modal dialog here would run a nested event loop inside
+                    # the interactor observer and could re-enter it
                     self.cleanupObservers()
+                    QTimer.singleShot(0, lambda: self.confirmAndCreateROI(ras))
                     return 1  # Prevent default handling
                     
         except Exception as e:
@@ -380,7 +590,7 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if key == 'Escape':
             logging.info("User clicked [Esc] on placing ROI center point")
             self.cleanupObservers()
-            slicer.mrmlScene.RemoveNode(self.tempMarkupNode)
+            self.hidePlacementFiducial()
             slicer.util.showStatusMessage("ROI placement cancelled.")
         return 1
     
@@ -431,18 +641,8 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if not self._parameterNode:
             return
         
-         # Generate unique name
-        base_name = "CropROI"
-        existing_names = [n.GetName() for n in slicer.util.getNodesByClass("vtkMRMLMarkupsROINode") 
-                        if n.GetName().startswith(base_name)]
-        
-        # Find next available number
-        i = 1
-        new_name = f"{base_name}_{i}"
-        while f"{base_name}_{i}" in existing_names:
-            i += 1
-            new_name = f"{base_name}_{i}"
-            
+        new_name = self._generateUniqueROIName()
+
         # Create new ROI
         roiNode = slicer.mrmlScene.AddNewNodeByClass('vtkMRMLMarkupsROINode', new_name)
         roiNode.CreateDefaultDisplayNodes()
@@ -472,8 +672,7 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                 
         # Update UI
         self._parameterNode.roiNode = roiNode
-        # Force the selector to update its list of available ROIs
-        self.ui.roiSelector.setMRMLScene(slicer.mrmlScene)
+        # The selector observes the scene, so the new ROI is already listed
         self.ui.roiSelector.setCurrentNode(roiNode)
         self.updateROISizeWidget()
         self.setControlsEnabled(True)  # Enable other controls now that we have ROI
@@ -489,21 +688,8 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if interactionNode and interactionNode.GetCurrentInteractionMode() == interactionNode.Place:
             interactionNode.SetCurrentInteractionMode(interactionNode.ViewTransform)
         
-        # Clean up observers
-        if hasattr(self, 'pointPlacementObserverTag') and hasattr(self, 'tempMarkupNode'):
-            try:
-                self.tempMarkupNode.RemoveObserver(self.pointPlacementObserverTag)
-            except:
-                pass
-            del self.pointPlacementObserverTag
-        
-        # Remove temp node
-        if hasattr(self, 'tempMarkupNode') and self.tempMarkupNode:
-            try:
-                slicer.mrmlScene.RemoveNode(self.tempMarkupNode)
-            except:
-                pass
-            self.tempMarkupNode = None
+        # Hide the marker until the next placement
+        self.hidePlacementFiducial()
             
     def onROILockToggled(self, unlocked):
         """Handle ROI lock/unlock toggle using global ROI_LOCKED default"""
@@ -526,7 +712,7 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def updateROILockState(self):
         """Update the ROI's interactive state based on lock status"""
         roiNode = self.ui.roiSelector.currentNode()
-        if not hasattr(self, '_parameterNode') or not self._parameterNode or roiNode is None:
+        if self._parameterNode is None or roiNode is None:
             return
         
         displayNode = roiNode.GetDisplayNode()
@@ -545,62 +731,78 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         except AttributeError:
             logging.warning("ROI node does not support SetLocked")
 
-        # Force view update
-        slicer.util.forceRenderAllViews()
+        # Request a view update
+        self._renderTimer.start()
     
     def updateParameterNode(self):
         """Update parameter node with additional validation"""
-        if not hasattr(self, '_parameterNode') or not self._parameterNode:
+        if self._parameterNode is None:
             return
             
         inputNode = self.ui.inputSelector.currentNode()
+        scene = slicer.mrmlScene
         
         # Store current state before changes
-        hadInputVolume = self._parameterNode.inputVolume is not None
-        hadOutputVolume = self._parameterNode.outputVolume is not None
-        
-        # Update parameter node based on UI
-        if inputNode:
-            self.ui.roiSelector.setEnabled(True)
-            self.ui.outputSelector.setEnabled(True)
+        previousNodes = (self._parameterNode.inputVolume, self._parameterNode.roiNode,
+                         self._parameterNode.outputVolume)
+        hadInputVolume = previousNodes[0] is not None
+        hadOutputVolume = previousNodes[2] is not None
+        
+        # Memoized extents and crops belong to the previous input volume
+        if inputNode is not self._parameterNode.inputVolume:
+            self.logic.invalidateCache()
+
+        # Batch the reference updates so observers see a single ModifiedEvent
+        rawNode = self._parameterNode.parameterNode
+        wasModifying = rawNode.StartModify()
+        try:
+            # Update parameter node based on UI
+            if inputNode:
+                self.ui.roiSelector.setEnabled(True)
+                self.ui.outputSelector.setEnabled(True)
             
-            # Update input volume reference
-            self._parameterNode.inputVolume = inputNode
+                # Update input volume reference
+                self._parameterNode.inputVolume = inputNode
             
-            logging.info(f"The input volume is: {self._parameterNode.inputVolume.GetName()}")
+                logging.info(f"The input volume is: {self._parameterNode.inputVolume.GetName()}")
             
-            # Focus slice views on the new input volume
-            self.focusSliceViewsOnVolume(inputNode)
+                # Focus slice views on the new input volume
+                self.focusSliceViewsOnVolume(inputNode)
         
-            # Update ROI reference if selector has a node
-            if self.ui.roiSelector.currentNode():
-                self._parameterNode.roiNode = self.ui.roiSelector.currentNode()
+                # Update ROI reference if selector has a node
+                if self.ui.roiSelector.currentNode():
+                    self._parameterNode.roiNode = self.ui.roiSelector.currentNode()
                 
-            # Update output volume reference if selector has a node
-            if self.ui.outputSelector.currentNode():
-                self._parameterNode.outputVolume = self.ui.outputSelector.currentNode()
+                # Update output volume reference if selector has a node
+                if self.ui.outputSelector.currentNode():
+                    self._parameterNode.outputVolume = self.ui.outputSelector.currentNode()
                 
-            # If we had an output volume but input was cleared, remove it
-            if not inputNode and hadOutputVolume:
-                slicer.mrmlScene.RemoveNode(self._parameterNode.outputVolume)
-                self._parameterNode.outputVolume = None
-        else:
-            self.ui.roiSelector.setEnabled(False)
-            self.ui.outputSelector.setEnabled(False)
+                # If we had an output volume but input was cleared, remove it
+                if not inputNode and hadOutputVolume:
+                    scene.RemoveNode(self._parameterNode.outputVolume)
+                    self._parameterNode.outputVolume = None
+            else:
+                self.ui.roiSelector.setEnabled(False)
+                self.ui.outputSelector.setEnabled(False)
             
-            # Clear references when no input is selected
-            if hadInputVolume:
-                self._parameterNode.inputVolume = None
-            if hadOutputVolume:
-                if self._parameterNode.outputVolume:
-                    slicer.mrmlScene.RemoveNode(self._parameterNode.outputVolume)
-                self._parameterNode.outputVolume = None
-            self._parameterNode.roiNode = None
+                # Clear references when no input is selected
+                if hadInputVolume:
+                    self._parameterNode.inputVolume = None
+                if hadOutputVolume:
+                    if self._parameterNode.outputVolume:
+                        scene.RemoveNode(self._parameterNode.outputVolume)
+                    self._parameterNode.outputVolume = None
+                self._parameterNode.roiNode = None
+        finally:
+            rawNode.EndModify(wasModifying)
     
-        # Force UI update
-        self.updateVolumeInfo()
-        self.checkApplyButtonEnabled()
-        self.updateSaveVolumeSelector()
+        # Refresh dependent UI only if a reference actually changed
+        currentNodes = (self._parameterNode.inputVolume, self._parameterNode.roiNode,
+                        self._parameterNode.outputVolume)
+        if currentNodes != previousNodes:
+            self.updateVolumeInfo()
+            self.checkApplyButtonEnabled()
+            self.updateSaveVolumeSelector()
     
     def focusSliceViewsOnVolume(self, volumeNode):
         """Center 2D slice views on the specified volume and display it as the background"""
@@ -625,19 +827,21 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                 (bounds[4] + bounds[5]) / 2,
             ]
 
-            # Access layout manager and update each slice view
-            layoutManager = slicer.app.layoutManager()
-
             # Get volume dimensions and spacing
             imageData = volumeNode.GetImageData()
             spacing = volumeNode.GetSpacing()
             dimensions = imageData.GetDimensions()
 
-            # Calculate full physical size of the volume in mm
+            # Calculate full physical size of the volume in mm, and the
+            # in-plane field of view for each slice orientation
             size_mm = [dimensions[i] * spacing[i] for i in range(3)]
+            fov_map = {
+                'Axial': (size_mm[0], size_mm[1]),
+                'Sagittal': (size_mm[1], size_mm[2]),
+                'Coronal': (size_mm[0], size_mm[2]),
+            }
 
-            for sliceViewName in ['Red', 'Yellow', 'Green']:
-                sliceWidget = layoutManager.sliceWidget(sliceViewName)
+            for sliceWidget in self.getSliceWidgets():
                 if sliceWidget:
                     sliceLogic = sliceWidget.sliceLogic()
                     if sliceLogic:
@@ -645,23 +849,18 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                         compositeNode = sliceLogic.GetSliceCompositeNode()
                         compositeNode.SetBackgroundVolumeID(volumeNode.GetID())
 
-                        # Center view on the volume
+                        # Center and zoom in one batch so the view updates once;
+                        # the explicit FOV is kept rather than refitting to all
                         sliceNode = sliceLogic.GetSliceNode()
-                        sliceNode.JumpSliceByCentering(*center)
-
-                        # Calculate and apply appropriate FOV
-                        viewAxis = sliceNode.GetOrientationString()
-                        if viewAxis == 'Axial':
-                            sliceNode.SetFieldOfView(size_mm[0], size_mm[1], 1)
-                        elif viewAxis == 'Sagittal':
-                            sliceNode.SetFieldOfView(size_mm[1], size_mm[2], 1)
-                        elif viewAxis == 'Coronal':
-                            sliceNode.SetFieldOfView(size_mm[0], size_mm[2], 1)
-
-                        # Refresh the view
-                        sliceLogic.FitSliceToAll()
+                        wasModifying = sliceNode.StartModify()
+                        try:
+                            sliceNode.JumpSliceByCentering(*center)
+                            width, height = fov_map.get(sliceNode.GetOrientationString(), fov_map['Axial'])
+                            sliceNode.SetFieldOfView(width, height, 1)
+                        finally:
+                            sliceNode.EndModify(wasModifying)
 
-            slicer.util.forceRenderAllViews()
+            self._renderTimer.start()
 
         except Exception as e:
             logging.error(f"Error focusing slice views: {str(e)}")
@@ -669,46 +868,46 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def cleanup(self) -> None:
         """Clean up when module is closed"""
         self.removeROIObservers()
+        self.removeObservers()  # Scene observers added through VTKObservationMixin
+        if self._parameterNode is not None and self._parameterNodeGuiTag is not None:
+            self._parameterNode.disconnectGui(self._parameterNodeGuiTag)
+            self._parameterNodeGuiTag = None
+        if self.logic is not None:
+            self.logic.removeObservers()
         
         # Clean up rename observers
-        if hasattr(self, '_parameterNode') and self._parameterNode:
-            if hasattr(self, 'inputVolumeObserverTag') and self.inputVolumeObserverTag:
-                try:
-                    self._parameterNode.inputVolume.RemoveObserver(self.inputVolumeObserverTag)
-                except:
-                    pass
-                self.inputVolumeObserverTag = None
-            if hasattr(self, 'outputVolumeObserverTag') and self.outputVolumeObserverTag:
-                try:
-                    self._parameterNode.outputVolume.RemoveObserver(self.outputVolumeObserverTag)
-                except:
-                    pass
-                self.outputVolumeObserverTag = None
-            
+        self._renameObservers.clear()
+
+        # Only disconnect what setup actually connected
+        if self._layoutManager is not None:
+            self._layoutManager.layoutChanged.disconnect(self._invalidateSliceCache)
+            self._layoutManager = None
+
+        # Remove the reusable placement marker
+        if self._placementFiducial is not None and self._placementFiducial.GetScene() is not None:
+            slicer.mrmlScene.RemoveNode(self._placementFiducial)
+        self._placementFiducial = None
+
         # Clean up timer
-        if hasattr(self, '_roiUpdateTimer'):
-            self._roiUpdateTimer.stop()
-            self._roiUpdateTimer.timeout.disconnect()
+        self._roiUpdateTimer.stop()
+        self._roiUpdateTimer.timeout.disconnect()
+        self._renderTimer.stop()
+        self._renderTimer.timeout.disconnect()
+        self._sizeApplyTimer.stop()
+        self._sizeApplyTimer.timeout.disconnect()
+        self._infoUpdateTimer.stop()
+        self._infoUpdateTimer.timeout.disconnect()
             
-        # Remove ROI observers properly
-        for observer in self.roiObservers:
-            if isinstance(observer, tuple):
-                caller, tag = observer
-                caller.RemoveObserver(tag)
-        self.roiObservers = []
-        
-        # Remove other observers and disconnect signals
-        if hasattr(self, 'ui') and self.ui:
+        # Disconnect signals (ROI observers were already removed above)
+        if self.ui is not None:
             if hasattr(self.ui, 'roiVisibilityButton'):
-                try:
-                    self.ui.roiVisibilityButton.toggled.disconnect()
-                except:
-                    pass
+                # Connected in setup under the same check
+                self.ui.roiVisibilityButton.toggled.disconnect(self.onROIVisibilityToggled)
         ScriptedLoadableModuleWidget.cleanup(self)
 
     def onOutputVolumeChanged(self, node):
         """Handle output volume changes - update info display"""
-        if self._parameterNode:
+        if self._parameterNode and self._parameterNode.outputVolume is not node:
             self._parameterNode.outputVolume = node
             self.updateVolumeInfo()  # Update display with new output volume info
         
@@ -719,41 +918,31 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             rawNode = parameterNode
 
         # Disconnect from previous parameter node
-        if self._parameterNode:
-            self._parameterNode.disconnectGui(self.ui)
-            # Remove observers
-            if hasattr(self, 'inputVolumeObserverTag') and self.inputVolumeObserverTag:
-                try:
-                    self._parameterNode.inputVolume.RemoveObserver(self.inputVolumeObserverTag)
-                except:
-                    pass
-                self.inputVolumeObserverTag = None
-            if hasattr(self, 'outputVolumeObserverTag') and self.outputVolumeObserverTag:
-                try:
-                    self._parameterNode.outputVolume.RemoveObserver(self.outputVolumeObserverTag)
-                except:
-                    pass
-                self.outputVolumeObserverTag = None
+        if self._parameterNode and self._parameterNodeGuiTag is not None:
+            self._parameterNode.disconnectGui(self._parameterNodeGuiTag)
+            self._parameterNodeGuiTag = None
+        # Observers are removed from the nodes they were added to, even if the
+        # parameter node has since pointed at other volumes
+        self._renameObservers.clear()
         
         # Wrap the raw node
         self._parameterNode = CropTBVolumeParameterNode(rawNode) if rawNode else None
 
         if self._parameterNode:
-            # Connect widgets manually with proper null checks
-            if hasattr(self.ui, 'fillValueSpinBox'):
-                self.ui.fillValueSpinBox.value = self._parameterNode.fillValue
-                self.ui.fillValueSpinBox.valueChanged.connect(
-                    lambda v: setattr(self._parameterNode, 'fillValue', v))
+            # Bind widgets tagged with SlicerParameterName in the .ui file (only the
+            # fill value: the selectors write the parameter node in updateParameterNode
+            # and onOutputVolumeChanged, which must see the change to refresh the UI)
+            self._parameterNodeGuiTag = self._parameterNode.connectGui(self.ui)
 
             # Observe input volume renames if it exists
             if self._parameterNode.inputVolume:
-                self.inputVolumeObserverTag = self._parameterNode.inputVolume.AddObserver(
-                    RENAMED_EVENT, self.onInputVolumeRenamed)
-            
+                self._renameObservers.add(self._parameterNode.inputVolume,
+                                          RENAMED_EVENT, self.onInputVolumeRenamed)
+
             # Observe output volume renames if it exists
             if self._parameterNode.outputVolume:
-                self.outputVolumeObserverTag = self._parameterNode.outputVolume.AddObserver(
-                    RENAMED_EVENT, self.onOutputVolumeRenamed)
+                self._renameObservers.add(self._parameterNode.outputVolume,
+                                          RENAMED_EVENT, self.onOutputVolumeRenamed)
             
             # Update all UI elements
             self.updateVolumeInfo()
@@ -761,22 +950,11 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
     def onROIModified(self, caller, event):
         """Handle ROI modification events"""
-        logging.debug(f"ROI modified - caller: {caller.GetClassName() if caller else 'None'}")
-        try:
-            if not self._parameterNode or not self._parameterNode.roiNode:
-                return
-                
-            current_roi = self._parameterNode.roiNode
-            
-            # Filter spurious MRML node events
-            if caller == current_roi or caller == current_roi.GetDisplayNode():
-                # Restart the debounce timer
-                # self._roiUpdateTimer.start(100)  # 100ms delay
-                # Update immediately without debouncing
-                self.updateROISizeWidget()
-            
-        except Exception as e:
-            logging.error(f"Error in onROIModified: {str(e)}")
+        # Debounce: every event restarts the single-shot timer, so a drag
+        # refreshes the spin boxes once, 80ms after the ROI stops changing
+        if self._updatingROI:
+            return
+        self._roiUpdateTimer.start()
 
     def onApply(self) -> None:
         with slicer.util.tryWithErrorDisplay("Failed to crop volume.", waitCursor=True):
@@ -790,68 +968,101 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             if selectedOutputNode is None:
                 self._autoCreateOutputVolume()
                 
-            if not self._parameterNode.outputVolume:
+            outputVolume = self._parameterNode.outputVolume
+            if not outputVolume:
                 raise ValueError("Output volume not created")
             
-            logging.info(f"The created output volume name is: {self._parameterNode.outputVolume.GetName()}")
-            self.logic.cropVolume()
+            logging.info(f"The created output volume name is: {outputVolume.GetName()}")
+            # The voxel copy runs off the main thread, so this dialog keeps repainting
+            progress = slicer.util.createProgressDialog(
+                windowTitle="Cropping", labelText="Cropping volume...", maximum=100)
+            progress.setCancelButton(None)
+
+            def onCropProgress(percent, message):
+                progress.labelText = message
+                progress.value = percent
+
+            try:
+                self.logic.cropVolume(progressCallback=onCropProgress)
+            finally:
+                progress.close()
             slicer.util.resetSliceViews()
             self.updateVolumeInfo()
             
-            # Show success message
-            QMessageBox.information(
-                None,
-                "Cropping Completed",
-                f"Cropping Succesful!\n\nOutput Volume Name: {self._parameterNode.outputVolume.GetName()}\n\nClick OK to continue.",
-                QMessageBox.Ok
-            )
+            # Report success without a modal box, so the user can keep working
+            slicer.util.showStatusMessage(f"Cropping successful. Output volume: {outputVolume.GetName()}", 5000)
             
             # Auto-select the output volume in the save selector
-            self.ui.saveVolumeSelector.setCurrentNode(self._parameterNode.outputVolume)
+            self.ui.saveVolumeSelector.setCurrentNode(outputVolume)
             
     def onROISizeChanged(self) -> None:
+        """Schedule a single ROI resize for a burst of spin box changes"""
+        self._sizeApplyTimer.start()
+
+    def _applyROISize(self) -> None:
         """Update ROI size while maintaining center position"""
+        if self._isCropping():
+            self._sizeApplyTimer.start()  # Apply once the crop has finished
+            return
         if not self._parameterNode or not self._parameterNode.roiNode:
             return
             
         roi = self._parameterNode.roiNode
-        new_size = [self.ui.sizeXSpinBox.value, 
-                    self.ui.sizeYSpinBox.value, 
-                    self.ui.sizeZSpinBox.value]
-        center = roi.GetCenter()
-        
+        new_size = self._size
+        new_size[0] = self.ui.sizeXSpinBox.value
+        new_size[1] = self.ui.sizeYSpinBox.value
+        new_size[2] = self.ui.sizeZSpinBox.value
+        center = list(roi.GetCenter())
+
         # Only update if size actually changed
-        current_size = roi.GetSize()
-        if (abs(new_size[0]-current_size[0]) > 0.01 or
-            abs(new_size[1]-current_size[1]) > 0.01 or
-            abs(new_size[2]-current_size[2]) > 0.01):
-            roi.SetSize(new_size)
-            roi.SetCenter(center)
+        current_size = np.asarray(roi.GetSize())
+        if not np.allclose(new_size, current_size, rtol=0, atol=0.01):
+            # Batch both changes so observers see a single ModifiedEvent; the
+            # spin boxes already show the new size, so skip the refresh it would trigger
+            self._updatingROI = True
+            wasModifying = roi.StartModify()
+            try:
+                roi.SetSize(new_size)
+                if list(roi.GetCenter()) != center:
+                    roi.SetCenter(center)
+            finally:
+                roi.EndModify(wasModifying)
+                self._updatingROI = False
     
     def _autoCreateOutputVolume(self):
         """Automatically create and name output volume based on input name"""
-        if not self._parameterNode.inputVolume:
+        inputVolume = self._parameterNode.inputVolume
+        if not inputVolume:
             return
         
         try:
-            input_name = self._parameterNode.inputVolume.GetName()
+            input_name = inputVolume.GetName()
             output_name = self._generateUniqueOutputName(input_name)
             
-            # Remove existing output volume if it follows our naming pattern
-            if (self._parameterNode.outputVolume and 
-                self._parameterNode.outputVolume.GetName().startswith("Cropped_")):
-                slicer.mrmlScene.RemoveNode(self._parameterNode.outputVolume)
-            
-            # Initialize with empty image data to prevent NoneType issues
-            output_node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLScalarVolumeNode", output_name)
-            imageData = vtk.vtkImageData()
-            output_node.SetAndObserveImageData(imageData)
-            
-            # Create default display nodes immediately
-            output_node.CreateDefaultDisplayNodes()
-        
-            self._parameterNode.outputVolume = output_node
-            if hasattr(self, 'ui') and self.ui and hasattr(self.ui, 'outputSelector'):
+            # Batch the parameter node reference changes so its observers see a single
+            # ModifiedEvent; a scene batch would make every scene observer fully refresh
+            scene = slicer.mrmlScene
+            rawNode = self._parameterNode.parameterNode
+            wasModifying = rawNode.StartModify()
+            try:
+                # Remove existing output volume if it follows our naming pattern
+                previousOutput = self._parameterNode.outputVolume
+                if previousOutput and CROPPED_NAME_RE.match(previousOutput.GetName()):
+                    scene.RemoveNode(previousOutput)
+
+                # Initialize with empty image data to prevent NoneType issues
+                output_node = scene.AddNewNodeByClass("vtkMRMLScalarVolumeNode", output_name)
+                imageData = vtk.vtkImageData()
+                output_node.SetAndObserveImageData(imageData)
+
+                # Create default display nodes immediately
+                output_node.CreateDefaultDisplayNodes()
+
+                self._parameterNode.outputVolume = output_node
+            finally:
+                rawNode.EndModify(wasModifying)
+
+            if self.ui is not None and hasattr(self.ui, 'outputSelector'):
                 self.ui.outputSelector.setCurrentNode(output_node)
             
             # Update volume info after creation
@@ -859,16 +1070,34 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         except Exception as e:
             logging.error(f"Error in _autoCreateOutputVolume: {str(e)}")
         
+    def _generateUniqueROIName(self):
+        """Generate unique CropROI_<n> name for an ROI created from a point"""
+        if self._roiNameCounter is None:
+            # First ROI since the scene was loaded: scan once for the highest number in use
+            numbers = []
+            for n in self._nodesByClass["vtkMRMLMarkupsROINode"].values():
+                match = ROI_NAME_RE.match(n.GetName())
+                if match:
+                    numbers.append(int(match.group(1)))
+            self._roiNameCounter = max(numbers, default=0)
+
+        self._roiNameCounter += 1
+        return f"CropROI_{self._roiNameCounter}"
+
     def _generateUniqueOutputName(self, base_name):
         """Generate unique output volume name with numbering"""
-        existing_names = [n.GetName() for n in slicer.util.getNodesByClass("vtkMRMLScalarVolumeNode") 
-                        if n.GetName().startswith(f"Cropped_{base_name}")]
-        
-        # Find next available number
-        i = 1
-        while f"Cropped_{base_name}_{i}" in existing_names:
-            i += 1
-        return f"Cropped_{base_name}_{i}"
+        if base_name not in self._outputNameCounters:
+            # First crop of this input: scan once for the highest number in use
+            numbers = []
+            for n in self._nodesByClass["vtkMRMLScalarVolumeNode"].values():
+                match = CROPPED_NAME_RE.match(n.GetName())
+                if match and match.group(1) == base_name:
+                    numbers.append(int(match.group(2)))
+            self._outputNameCounters[base_name] = max(numbers, default=0)
+
+        # Numbers only ever increase, so removed outputs are never reused
+        self._outputNameCounters[base_name] += 1
+        return f"Cropped_{base_name}_{self._outputNameCounters[base_name]}"
             
     def onROIVisibilityToggled(self, checked):
         """Toggle ROI visibility with better error handling"""
@@ -891,8 +1120,8 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                 # Update button text
                 self.ui.roiVisibilityButton.setText("Show ROI" if checked else "Hide ROI")
                 
-                # Force view update
-                slicer.util.forceRenderAllViews()
+                # Schedule one render for a burst of toggles
+                self._renderTimer.start()
         except Exception as e:
             logging.error(f"Error in onROIVisibilityToggled: {str(e)}")
         
@@ -901,19 +1130,25 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         vol = self._parameterNode.inputVolume
         roi = self._parameterNode.roiNode
         if vol and roi:
-            bounds = [0]*6
+            # Compute center and size in the preallocated buffers
+            bounds = self._bounds
             vol.GetRASBounds(bounds)
-            center = [(bounds[1]+bounds[0])/2, (bounds[3]+bounds[2])/2, (bounds[5]+bounds[4])/2]
-            size = [(bounds[1]-bounds[0]), (bounds[3]-bounds[2]), (bounds[5]-bounds[4])]
-            roi.SetCenter(center)
-            roi.SetSize(size)
-        self.updateVolumeInfo()  # Make sure to update info after fitting
+            np.add(bounds[0::2], bounds[1::2], out=self._center)
+            self._center *= 0.5
+            np.subtract(bounds[1::2], bounds[0::2], out=self._size)
+            # Batch both changes so observers see a single ModifiedEvent
+            wasModifying = roi.StartModify()
+            try:
+                roi.SetCenter(self._center)
+                roi.SetSize(self._size)
+            finally:
+                roi.EndModify(wasModifying)
 
     def updateROISizeWidget(self) -> None:
         """Update UI size widget from ROI node"""
         try:
-            if (not hasattr(self, 'ui') or not self.ui or 
-                not self._parameterNode or not self._parameterNode.roiNode):
+            if (self.ui is None or self._parameterNode is None or
+                not self._parameterNode.roiNode):
                 return
                 
             roi = self._parameterNode.roiNode
@@ -922,90 +1157,112 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             size = roi.GetSize()
             
             # Only update if values actually changed
-            current_x = self.ui.sizeXSpinBox.value
-            current_y = self.ui.sizeYSpinBox.value
-            current_z = self.ui.sizeZSpinBox.value
-            
-            if (abs(size[0] - current_x) > 0.01 or
-                abs(size[1] - current_y) > 0.01 or
-                abs(size[2] - current_z) > 0.01):
-                
-                # Block signals to prevent infinite loops
-                self.ui.sizeXSpinBox.blockSignals(True)
-                self.ui.sizeYSpinBox.blockSignals(True)
-                self.ui.sizeZSpinBox.blockSignals(True)
-                
-                # Update spin boxes with formatted values
-                self.ui.sizeXSpinBox.setValue(round(size[0], 2))
-                self.ui.sizeYSpinBox.setValue(round(size[1], 2))
-                self.ui.sizeZSpinBox.setValue(round(size[2], 2))
-                
-                # Force immediate update
-                self.ui.sizeXSpinBox.repaint()
-                self.ui.sizeYSpinBox.repaint()
-                self.ui.sizeZSpinBox.repaint()
-                
+            current = (self.ui.sizeXSpinBox.value, self.ui.sizeYSpinBox.value, self.ui.sizeZSpinBox.value)
+            if not np.allclose(size, current, rtol=0, atol=0.01):
+                # Suspend painting so the three updates are drawn in one pass
+                sizeGroupBox = self.ui.roiSizeGroupBox
+                sizeGroupBox.setUpdatesEnabled(False)
+                try:
+                    # Update spin boxes with formatted values
+                    self._setSizeSpinboxes(round(size[0], 2), round(size[1], 2), round(size[2], 2))
+                finally:
+                    sizeGroupBox.setUpdatesEnabled(True)
+                    sizeGroupBox.update()
+
         except Exception as e:
             logging.error(f"Error in updateROISizeWidget: {str(e)}")
-        finally:
-            # Always unblock signals
-            self.ui.sizeXSpinBox.blockSignals(False)
-            self.ui.sizeYSpinBox.blockSignals(False)
-            self.ui.sizeZSpinBox.blockSignals(False)
+
+    def _setSizeSpinboxes(self, sx, sy, sz) -> None:
+        """Set the ROI size spin boxes without emitting valueChanged, so the ROI is not written back"""
+        with blockedSignals(self.ui.sizeXSpinBox, self.ui.sizeYSpinBox, self.ui.sizeZSpinBox):
+            self.ui.sizeXSpinBox.value = sx
+            self.ui.sizeYSpinBox.value = sy
+            self.ui.sizeZSpinBox.value = sz
 
     def updateVolumeInfo(self) -> None:
+        """Schedule a single info label refresh for a burst of requests"""
+        self._infoUpdateTimer.start()
+
+    def _doUpdateVolumeInfo(self) -> None:
         """Update volume information display - only shows output info when output volume exists"""
-        # Clear both labels first
-        self.ui.inputInfoLabel.setText("Input: ")
-        self.ui.outputInfoLabel.setText("Output: ")
-        
-        # Handle input volume information
-        if self._parameterNode:
-            if self._parameterNode.inputVolume is not None:  # Explicit None check
-                try:
-                    inputSpacing = self._parameterNode.inputVolume.GetSpacing()
-                    inputImageData = self._parameterNode.inputVolume.GetImageData()
-                    if inputImageData:  # Check if image data exists
-                        inputDims = inputImageData.GetDimensions()
-                        self.ui.inputInfoLabel.setText(
-                            f"Input: {inputDims[0]}x{inputDims[1]}x{inputDims[2]} "
-                            f"({inputSpacing[0]:.2f}x{inputSpacing[1]:.2f}x{inputSpacing[2]:.2f} mm)")
-                    else:
-                        self.ui.inputInfoLabel.setText("Input: (no image data)")
-                except Exception as e:
-                    logging.error(f"Error updating input info: {str(e)}")
-                    self.ui.inputInfoLabel.setText("Input: (error)")
-            else:
-                # Explicitly handle None input volume case
-                self.ui.inputInfoLabel.setText("Input: (none)")
-                self.ui.outputInfoLabel.setText("Output: (none)")
-        
-        # Handle output volume info
-        if self._parameterNode:
-            if self._parameterNode.outputVolume:
-                try:
-                    outputSpacing = self._parameterNode.outputVolume.GetSpacing()
-                    outputImageData = self._parameterNode.outputVolume.GetImageData()
-                    if outputImageData:  # Check if image data exists
-                        outputDims = outputImageData.GetDimensions()
-                        self.ui.outputInfoLabel.setText(
-                            f"Output: {outputDims[0]}x{outputDims[1]}x{outputDims[2]} "
-                            f"({outputSpacing[0]:.2f}x{outputSpacing[1]:.2f}x{outputSpacing[2]:.2f} mm)")
-                    else:
-                        self.ui.outputInfoLabel.setText("Output: (no image data)")
-                except Exception as e:
-                    logging.error(f"Error updating output info: {str(e)}")
-                    self.ui.outputInfoLabel.setText("Output: (error)")
+        if self._isCropping():
+            self._infoUpdateTimer.start()  # The output is being rewritten; refresh afterwards
+            return
+        # Nodes churn during scene loads and closes; refresh once at EndBatchProcessEvent
+        if slicer.mrmlScene.IsBatchProcessing():
+            return
+        # Hidden labels are refreshed by refreshHiddenWidgets when the module is shown
+        if not self.ui.inputInfoLabel.isVisible():
+            return
+
+        # Skip the VTK queries and label rebuilds if neither volume has changed
+        inputVolume = self._parameterNode.inputVolume if self._parameterNode else None
+        outputVolume = self._parameterNode.outputVolume if self._parameterNode else None
+        infoKey = (self._parameterNode is not None,
+                   self._volumeInfoKey(inputVolume),
+                   self._volumeInfoKey(outputVolume))
+        if infoKey == self._lastInfoKey:
+            return
+        self._lastInfoKey = infoKey
+
+        if self._parameterNode is None:
+            self._setLabelText(self.ui.inputInfoLabel, "Input: ")
+            self._setLabelText(self.ui.outputInfoLabel, "Output: ")
+            return
+
+        self._setLabelText(self.ui.inputInfoLabel, self._formatVolumeInfo(inputVolume, "Input"))
+        self._setLabelText(self.ui.outputInfoLabel, self._formatVolumeInfo(outputVolume, "Output"))
+
+    @staticmethod
+    def _setLabelText(label, text):
+        """Set the label text only if it differs, avoiding a relayout and repaint"""
+        if label.text != text:
+            label.setText(text)
+
+    @staticmethod
+    def _volumeInfoKey(volume):
+        """Return a key that changes whenever the volume's displayed info may change"""
+        if volume is None:
+            return None
+        # Image data can be replaced or resized in place without touching the node's MTime
+        imageData = volume.GetImageData()
+        return (volume.GetID(), volume.GetMTime(), imageData.GetMTime() if imageData else 0)
+
+    def _formatVolumeInfo(self, volume, prefix) -> str:
+        """Return the info label text for a volume, memoized on the volume's MTime"""
+        if volume is None:
+            return f"{prefix}: (none)"
+
+        key = self._volumeInfoKey(volume)
+        cached = self._volumeInfoCache.get(prefix)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            imageData = volume.GetImageData()
+            if imageData:  # Check if image data exists
+                text = VOLUME_INFO_FORMAT % (prefix, *imageData.GetDimensions(), *volume.GetSpacing())
             else:
-                # Explicitly handle None output volume case
-                self.ui.outputInfoLabel.setText("Output: (none)")
+                text = f"{prefix}: (no image data)"
+        except Exception as e:
+            logging.error(f"Error updating {prefix.lower()} info: {str(e)}")
+            return f"{prefix}: (error)"
 
-    def onInputVolumeRenamed(self, node):
+        self._volumeInfoCache[prefix] = (key, text)
+        return text
+
+    def onInputVolumeRenamed(self, node, event=None):
         """Handle input volume rename and update output volume name if needed"""
+        self._lastInfoKey = None  # Force the info labels to refresh
+        # A rename can be signalled more than once; only act on a new name
+        renameKey = (node.GetID(), node.GetName()) if node else None
+        if renameKey == self._lastRenameHandled:
+            return
+        self._lastRenameHandled = renameKey
         if node and node == self._parameterNode.inputVolume:
             # Only update output name if it follows our auto-naming pattern
             if (self._parameterNode.outputVolume and 
-                self._parameterNode.outputVolume.GetName().startswith("Cropped_")):
+                CROPPED_NAME_RE.match(self._parameterNode.outputVolume.GetName())):
                 self._autoCreateOutputVolume()
 
     def onROIRenamed(self, node):
@@ -1014,8 +1271,9 @@ class CropTBVolumeWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             # No special handling needed for ROI rename
             pass
         
-    def onOutputVolumeRenamed(self, node):
+    def onOutputVolumeRenamed(self, node, event=None):
         """Handle output volume rename"""
+        self._lastInfoKey = None  # Force the info labels to refresh
         if node and node == self._parameterNode.outputVolume:
             # No special handling needed for output rename
             pass
@@ -1043,7 +1301,7 @@ class CropTBVolume(ScriptedLoadableModule):
 # CropTBVolumeLogic
 #
 
-class CropTBVolumeLogic(ScriptedLoadableModuleLogic):
+class CropTBVolumeLogic(ScriptedLoadableModuleLogic, VTKObservationMixin):
     """This class should implement all the actual
     computation done by your module.  The interface
     should be such that other python code can import
@@ -1055,13 +1313,33 @@ class CropTBVolumeLogic(ScriptedLoadableModuleLogic):
 
     def __init__(self):
         ScriptedLoadableModuleLogic.__init__(self)
+        VTKObservationMixin.__init__(self)
         self._parameterNode = None  # Initialize first
+        self._wrappedParameterNode = None  # (raw node, wrapper) returned by parameterNode
         self._parameterNode = self.getParameterNode()
+        self._geometryCache = OrderedDict()  # volume ID -> ((node MTime, image MTime), ijkToRas, rasToIjk, dims - 1), LRU order
+        self._extentCache = None  # (extent key, extent)
+        self._lastCrop = None  # (crop key, output node MTime, output image MTime)
+        self.isCropping = False  # True while a large voxel copy runs on a worker thread
+
+    @vtk.calldata_type(vtk.VTK_OBJECT)
+    def onNodeRemoved(self, caller, event, node):
+        """Drop cached geometry of volumes removed from the scene"""
+        self._geometryCache.pop(node.GetID(), None)
+
+    def invalidateCache(self) -> None:
+        """Forget memoized extents and the last crop, e.g. when the input volume changes"""
+        self._extentCache = None
+        self._lastCrop = None
 
     @property
     def parameterNode(self) -> CropTBVolumeParameterNode:
         """Return the wrapped parameter node (preferred access method)"""
-        return CropTBVolumeParameterNode(self.getParameterNode())
+        # Rewrap only when the raw node changes, e.g. after a scene close or load
+        rawNode = self.getParameterNode()
+        if self._wrappedParameterNode is None or self._wrappedParameterNode[0] is not rawNode:
+            self._wrappedParameterNode = (rawNode, CropTBVolumeParameterNode(rawNode))
+        return self._wrappedParameterNode[1]
     
     @property
     def wrappedParameterNode(self) -> CropTBVolumeParameterNode:
@@ -1083,147 +1361,262 @@ class CropTBVolumeLogic(ScriptedLoadableModuleLogic):
             wrappedNode.isotropicSpacing = False
         return paramNode
     
-    def cropVolume(self) -> None:
-        """Perform the volume cropping operation"""
+    def cropVolume(self, progressCallback=None) -> None:
+        """Perform the volume cropping operation, reporting (percent, message) to progressCallback"""
+        def reportProgress(percent, message):
+            if progressCallback is not None:
+                progressCallback(percent, message)
+
+        # Each parameter access is a scripted module node lookup, so read them once
         p = self.parameterNode
-        if not p.inputVolume or not p.inputVolume.GetImageData():
+        inputVolume, outputVolume, roiNode = p.inputVolume, p.outputVolume, p.roiNode
+        if not inputVolume or not inputVolume.GetImageData():
             raise ValueError("Input volume has no image data")
-        if not p.outputVolume:
+        if not outputVolume:
             raise ValueError("Output volume not specified")
-        if not p.roiNode:
+        if not roiNode:
             raise ValueError("ROI not specified")
 
         try:            
             # Voxel-based cropping (no resampling)
             # Get input volume properties
-            input_spacing = p.inputVolume.GetSpacing()
-            input_ijk_to_ras = vtk.vtkMatrix4x4()
-            p.inputVolume.GetIJKToRASMatrix(input_ijk_to_ras)
+            input_spacing = inputVolume.GetSpacing()
+            ijk_to_ras, ras_to_ijk, max_ijk = self._getVolumeGeometry(inputVolume)
             
             # Get ROI bounds in RAS
-            ras_bounds = np.zeros(6)
-            p.roiNode.GetBounds(ras_bounds)
+            ras_bounds = [0.0] * 6
+            roiNode.GetBounds(ras_bounds)
             
-            # Calculate voxel-aligned extent
-            extent = self._calculateVoxelBasedOutputExtent(ras_bounds, 
-                                                        p.inputVolume.GetOrigin(),
-                                                        input_spacing,
-                                                        input_ijk_to_ras,
-                                                        p.inputVolume)
+            # Calculate voxel-aligned extent; ROI moves smaller than a voxel
+            # map to the same extent, so reuse the last one for identical inputs
+            input_dims = inputVolume.GetImageData().GetDimensions()
+            extentKey = (tuple(ras_bounds), tuple(input_spacing), ijk_to_ras.tobytes(), input_dims)
+            if self._extentCache is not None and self._extentCache[0] == extentKey:
+                extent = self._extentCache[1]
+            else:
+                extent = self._calculateVoxelBasedOutputExtent(ras_bounds, ras_to_ijk, max_ijk)
+                self._extentCache = (extentKey, extent)
             
             # Verify extent is valid
-            input_dims = p.inputVolume.GetImageData().GetDimensions()
             if (extent[0] < 0 or extent[1] >= input_dims[0] or
                 extent[2] < 0 or extent[3] >= input_dims[1] or
                 extent[4] < 0 or extent[5] >= input_dims[2]):
                 raise ValueError("Calculated extent is outside input volume bounds")
+            reportProgress(10, "Copying voxels...")
+
+            # Nothing to do if the output still holds this exact crop; the input geometry is
+            # part of the key, as a sub-voxel origin shift keeps the extent but moves the output
+            cropKey = (tuple(extent), inputVolume.GetID(), inputVolume.GetImageData().GetMTime(),
+                       ijk_to_ras.tobytes(), tuple(input_spacing), outputVolume.GetID())
+            outputImage = outputVolume.GetImageData()
+            if (self._lastCrop is not None and self._lastCrop[0] == cropKey and outputImage is not None
+                    and self._lastCrop[1:] == (outputVolume.GetMTime(), outputImage.GetMTime())):
+                # The voxels are current, but the views may have been switched to other volumes
+                logging.info("Voxel-based crop unchanged, skipping the copy. Extent: %s", extent)
+                reportProgress(85, "Updating slice views...")
+                self._showInSliceViews(outputVolume)
+                reportProgress(100, "Crop unchanged")
+                return
             
-            # Extract VOI from input volume
-            extract = vtk.vtkExtractVOI()
-            extract.SetInputData(p.inputVolume.GetImageData())
-            extract.SetVOI(extent)
-            extract.Update()
-            
-            outputImage = extract.GetOutput()
-            # Get dimensions before modifying extent
-            dims = outputImage.GetDimensions()
-            
-            # Reset the extent to 0-based for Slicer compatibility
-            outputImage.SetExtent(0, dims[0]-1, 0, dims[1]-1, 0, dims[2]-1)
-            
-            # Get the extracted region's bounds in RAS
-            ijk_min = [extent[0], extent[2], extent[4]]
-            
-            # Calculate new origin using the input's IJKToRAS matrix
-            transform = vtk.vtkTransform()
-            transform.SetMatrix(input_ijk_to_ras)
-            new_origin = transform.TransformPoint(ijk_min)
+            # Slice the crop region out of a (K, J, I) view of the input voxels
+            inputArray = self._arrayFromImageData(inputVolume.GetImageData())
+            croppedView = inputArray[extent[4]:extent[5]+1,
+                                     extent[2]:extent[3]+1,
+                                     extent[0]:extent[1]+1]
+            dims = (croppedView.shape[2], croppedView.shape[1], croppedView.shape[0])
+
+            outputArray = None
+            if outputImage is not None and outputImage.GetPointData().GetScalars() is not None:
+                outputArray = self._arrayFromImageData(outputImage)
+
+            if (outputArray is not None and outputArray.shape == croppedView.shape
+                    and outputArray.dtype == croppedView.dtype):
+                # Same dimensions and scalar type as the previous crop: overwrite
+                # the existing voxel buffer instead of allocating a new one
+                self._copyCroppedVoxels(croppedView, outputArray)
+                slicer.util.arrayFromVolumeModified(outputVolume)
+            else:
+                # Only the crop region is copied into a new contiguous buffer
+                croppedArray = np.empty(croppedView.shape, dtype=croppedView.dtype)
+                self._copyCroppedVoxels(croppedView, croppedArray)
+
+                # Wrap the NumPy buffer in a 0-based vtkImageData without copying
+                outputImage = vtk.vtkImageData()
+                outputImage.SetDimensions(dims)
+                scalars = nps.numpy_to_vtk(croppedArray.reshape(dims[0]*dims[1]*dims[2], -1), deep=False,
+                                           array_type=nps.get_vtk_array_type(croppedArray.dtype))
+                scalars.SetName("ImageScalars")
+                # numpy_to_vtk keeps croppedArray referenced from the scalars for their lifetime
+                outputImage.GetPointData().SetScalars(scalars)
+
+            reportProgress(70, "Updating output geometry...")
+
+            # Calculate new origin by mapping the first cropped voxel through
+            # the input's IJKToRAS matrix
+            ijk_min = np.array([extent[0], extent[2], extent[4]], dtype=np.float64)
+            new_origin = (ijk_to_ras[:3, :3] @ ijk_min + ijk_to_ras[:3, 3]).tolist()
             
             # Create a new IJKToRAS matrix for the cropped volume
-            cropped_ijk_to_ras = vtk.vtkMatrix4x4()
-            cropped_ijk_to_ras.DeepCopy(input_ijk_to_ras)
-            cropped_ijk_to_ras.SetElement(0, 3, new_origin[0])
-            cropped_ijk_to_ras.SetElement(1, 3, new_origin[1])
-            cropped_ijk_to_ras.SetElement(2, 3, new_origin[2])
+            cropped_array = ijk_to_ras.copy()
+            cropped_array[:3, 3] = new_origin
+            cropped_ijk_to_ras = slicer.util.vtkMatrixFromArray(cropped_array)
             
             # Set output properties
-            p.outputVolume.SetAndObserveImageData(outputImage)
-            p.outputVolume.SetSpacing(input_spacing)
-            p.outputVolume.SetIJKToRASMatrix(cropped_ijk_to_ras)
-            
-            # IMPORTANT: Reset slice views BEFORE setting the new volume
-            slicer.util.resetSliceViews()
-            
-            # Set the new volume as background in all slice views
-            layoutManager = slicer.app.layoutManager()
-            for sliceViewName in ['Red', 'Yellow', 'Green']:
-                sliceWidget = layoutManager.sliceWidget(sliceViewName)
-                if sliceWidget:
-                    sliceLogic = sliceWidget.sliceLogic()
-                    if sliceLogic:
-                        compositeNode = sliceLogic.GetSliceCompositeNode()
-                        compositeNode.SetBackgroundVolumeID(p.outputVolume.GetID())
-            
-            # Calculate center of the cropped volume in RAS
-            p.outputVolume.GetRASBounds(ras_bounds)
-            center = [
-                (ras_bounds[0] + ras_bounds[1]) / 2,
-                (ras_bounds[2] + ras_bounds[3]) / 2,
-                (ras_bounds[4] + ras_bounds[5]) / 2,
-            ]
-            
-            # Center all slice views using the proper method
-            for sliceViewName in ['Red', 'Yellow', 'Green']:
-                sliceWidget = layoutManager.sliceWidget(sliceViewName)
-                if sliceWidget:
-                    sliceNode = sliceWidget.sliceLogic().GetSliceNode()
-                    sliceNode.JumpSliceByCentering(center[0], center[1], center[2])
+            outputVolume.SetAndObserveImageData(outputImage)
+            outputVolume.SetSpacing(input_spacing)
+            outputVolume.SetIJKToRASMatrix(cropped_ijk_to_ras)
+
+            reportProgress(85, "Updating slice views...")
 
-            slicer.util.forceRenderAllViews()
+            self._showInSliceViews(outputVolume)
+            self._lastCrop = (cropKey, outputVolume.GetMTime(), outputImage.GetMTime())
+            reportProgress(100, "Crop complete")
             
             logging.info(
-                f"Voxel-based crop applied. "
-                f"Extent: {extent}, "
-                f"Dimensions: {dims}, "
-                f"Spacing: {input_spacing}, "
-                f"Origin: {new_origin}"
+                "Voxel-based crop applied. Extent: %s, Dimensions: %s, Spacing: %s, Origin: %s",
+                extent, dims, input_spacing, new_origin
             )
         except Exception as e:
             logging.error(f"Error in cropVolume: {str(e)}")
             raise
 
-    def _calculateVoxelBasedOutputExtent(self, roiBounds, inputOrigin, inputSpacing, ijkToRas, inputVolume):
-        """Calculate voxel-aligned extent with proper coordinate handling"""
-        rasToIjk = vtk.vtkMatrix4x4()
-        vtk.vtkMatrix4x4.Invert(ijkToRas, rasToIjk)
-        
-        # Transform all ROI corners to IJK
-        boundsCorners = [
-            [roiBounds[0], roiBounds[2], roiBounds[4], 1],
-            [roiBounds[1], roiBounds[2], roiBounds[4], 1],
-            [roiBounds[0], roiBounds[3], roiBounds[4], 1],
-            [roiBounds[1], roiBounds[3], roiBounds[4], 1],
-            [roiBounds[0], roiBounds[2], roiBounds[5], 1],
-            [roiBounds[1], roiBounds[2], roiBounds[5], 1],
-            [roiBounds[0], roiBounds[3], roiBounds[5], 1],
-            [roiBounds[1], roiBounds[3], roiBounds[5], 1]
+    @staticmethod
+    def _showInSliceViews(volumeNode):
+        """Show the volume as background in the slice views and center them on it"""
+        # Calculate center of the volume in RAS
+        ras_bounds = [0.0] * 6
+        volumeNode.GetRASBounds(ras_bounds)
+        center = [
+            (ras_bounds[0] + ras_bounds[1]) / 2,
+            (ras_bounds[2] + ras_bounds[3]) / 2,
+            (ras_bounds[4] + ras_bounds[5]) / 2,
         ]
-        ijkCorners = []
-        for corner in boundsCorners:
-            pt = [0.0, 0.0, 0.0, 0.0]
-            rasToIjk.MultiplyPoint(corner, pt)
-            ijkCorners.append(pt[:3])
-        
-        ijkCorners = np.array(ijkCorners)
+
+        # Set the background and center in one pass, one lookup per view
+        layoutManager = slicer.app.layoutManager()
+        if layoutManager is None:
+            return
+        volumeID = volumeNode.GetID()
+        for sliceViewName in ('Red', 'Yellow', 'Green'):
+            sliceWidget = layoutManager.sliceWidget(sliceViewName)
+            sliceLogic = sliceWidget.sliceLogic() if sliceWidget else None
+            if sliceLogic:
+                sliceLogic.GetSliceCompositeNode().SetBackgroundVolumeID(volumeID)
+                sliceLogic.GetSliceNode().JumpSliceByCentering(*center)
+
+        # Views only schedule renders for the node changes above; draw them once here
+        slicer.util.forceRenderAllViews()
+
+    @staticmethod
+    def _arrayFromImageData(imageData):
+        """Return a zero-copy (K, J, I) NumPy view sharing the image's scalar buffer"""
+        scalars = imageData.GetPointData().GetScalars()
+        shape = tuple(reversed(imageData.GetDimensions()))
+        if scalars.GetNumberOfComponents() > 1:
+            shape += (scalars.GetNumberOfComponents(),)
+        return nps.vtk_to_numpy(scalars).reshape(shape)
+
+    def _copyCroppedVoxels(self, source, target):
+        """Copy the crop region, off the main thread only when it is large"""
+        if source.nbytes < PARALLEL_COPY_MIN_BYTES:
+            # Quick enough to block on; no worker thread or event processing
+            self._copyVoxels(source, target)
+            return
+        # Qt events still run during the copy: isCropping lets the widget defer its
+        # timers (ROI resize, info labels, renders) until the buffer is complete
+        self.isCropping = True
+        try:
+            self._runInBackground(self._copyVoxels, source, target)
+        finally:
+            self.isCropping = False
+
+    @staticmethod
+    def _runInBackground(function, *args):
+        """Run function on a worker thread while the main thread keeps processing Qt events"""
+        # Only NumPy work may run here: MRML and VTK rendering stay on the main thread.
+        # User input is held back so the scene cannot change under the worker.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(function, *args)
+            while not wait([future], timeout=0.02).done:
+                slicer.app.processEvents(qt.QEventLoop.ExcludeUserInputEvents)
+            return future.result()
+
+    @staticmethod
+    def _copyVoxels(source, target):
+        """Copy source into the same-shaped target array, in parallel Z slabs for large crops"""
+        workers = os.cpu_count() or 1
+        if source.nbytes < PARALLEL_COPY_MIN_BYTES or workers < 2 or len(source) < 2:
+            target[...] = source
+            return
+
+        # NumPy releases the GIL for bulk copies, so slabs copy concurrently
+        bounds = np.linspace(0, len(source), min(workers, len(source)) + 1).astype(int)
+
+        def copySlab(k0, k1):
+            target[k0:k1] = source[k0:k1]
+
+        with ThreadPoolExecutor(max_workers=len(bounds) - 1) as executor:
+            # list() re-raises any exception from the workers
+            list(executor.map(copySlab, bounds[:-1], bounds[1:]))
+
+    def _getVolumeGeometry(self, volumeNode):
+        """Return (ijkToRas, rasToIjk, dims - 1) as NumPy arrays, cached until the volume is modified"""
+        # Image data can be replaced or resized in place without touching the node's MTime
+        imageData = volumeNode.GetImageData()
+        mtime = (volumeNode.GetMTime(), imageData.GetMTime())
+        volumeID = volumeNode.GetID()
+        cached = self._geometryCache.get(volumeID)
+        if cached is None or cached[0] != mtime:
+            matrix = vtk.vtkMatrix4x4()
+            volumeNode.GetIJKToRASMatrix(matrix)
+            ijkToRas = slicer.util.arrayFromVTKMatrix(matrix)
+            dimsMinusOne = np.array(imageData.GetDimensions(), dtype=int) - 1
+            # Replacing the entry evicts the stale one for this volume
+            cached = (mtime, ijkToRas, np.linalg.inv(ijkToRas), dimsMinusOne)
+            # Observe the scene only once there is something to evict, so a logic
+            # that never caches geometry does not leave an observer behind
+            if not self.hasObserver(slicer.mrmlScene, slicer.mrmlScene.NodeRemovedEvent, self.onNodeRemoved):
+                self.addObserver(slicer.mrmlScene, slicer.mrmlScene.NodeRemovedEvent, self.onNodeRemoved)
+            self._geometryCache[volumeID] = cached
+            if len(self._geometryCache) > GEOMETRY_CACHE_SIZE:
+                self._geometryCache.popitem(last=False)  # Least recently used volume
+        self._geometryCache.move_to_end(volumeID)
+        return cached[1:]
+
+    @staticmethod
+    def _isAxisAligned(matrix):
+        """Return True if the 3x3 linear part of a 4x4 matrix is a scaled signed permutation"""
+        # Exactly one non-zero per row and column: each IJK axis follows one RAS axis
+        nonZero = np.abs(matrix[:3, :3]) > 1e-9
+        return bool(np.all(nonZero.sum(axis=0) == 1) and np.all(nonZero.sum(axis=1) == 1))
+
+    @staticmethod
+    def _calculateVoxelBasedOutputExtent(roiBounds, rasToIjk, maxIJK):
+        """Calculate voxel-aligned extent with proper coordinate handling (maxIJK is input dims - 1)"""
+        # Origin and spacing are already part of rasToIjk
+        roiBounds = np.asarray(roiBounds, dtype=np.float64)
+        if CropTBVolumeLogic._isAxisAligned(rasToIjk):
+            # IJK axes are parallel to RAS axes, possibly flipped or permuted
+            # (typical for CT): the two extreme ROI corners already bound the box
+            rasCorners = np.stack((roiBounds[0::2], roiBounds[1::2]))
+        else:
+            # Oblique volume: all eight ROI corners are needed
+            rasCorners = roiBounds[CORNER_IDX]
+
+        # Transform the ROI corners to IJK with a single matrix product; applying
+        # the translation separately avoids building homogeneous coordinates
+        ijkCorners = rasCorners @ rasToIjk[:3, :3].T + rasToIjk[:3, 3]
+
         ijkMin = np.floor(ijkCorners.min(axis=0)).astype(int)
         ijkMax = np.ceil(ijkCorners.max(axis=0)).astype(int)
         
-        # Clamp to valid input dimensions
-        inputDims = inputVolume.GetImageData().GetDimensions()
-        ijkMin = np.clip(ijkMin, [0, 0, 0], [inputDims[0]-1, inputDims[1]-1, inputDims[2]-1])
-        ijkMax = np.clip(ijkMax, [0, 0, 0], [inputDims[0]-1, inputDims[1]-1, inputDims[2]-1])
-        
-        return [ijkMin[0], ijkMax[0], ijkMin[1], ijkMax[1], ijkMin[2], ijkMax[2]]
+        # Clamp to valid input dimensions in place
+        for ijk in (ijkMin, ijkMax):
+            np.maximum(ijk, 0, out=ijk)
+            np.minimum(ijk, maxIJK, out=ijk)
+
+        # Interleave as [iMin, iMax, jMin, jMax, kMin, kMax] plain ints
+        return np.column_stack((ijkMin, ijkMax)).ravel().tolist()
         
 #
 # CropTBVolumeTest
@@ -1241,37 +1634,39 @@ class CropTBVolumeTest(ScriptedLoadableModuleTest):
         ScriptedLoadableModuleTest.setUp(self)
         slicer.mrmlScene.Clear(0)
         
-        # Initialize logic first
-        self.logic = CropTBVolumeLogic()
-        if not self.logic:
-            self.fail("Logic creation failed")
-            
         # Create test nodes first
         self.inputVolume = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLScalarVolumeNode", "TestInput")
         self.roi = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLMarkupsROINode", "TestROI")
         self.outputVolume = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLScalarVolumeNode", "TestOutput")
         
-        # Create test volume data
-        arr = np.random.rand(50, 50, 50) * 100
-        imageData = vtk.vtkImageData()
-        imageData.SetDimensions(50, 50, 50)
-        imageData.AllocateScalars(vtk.VTK_FLOAT, 1)
-        nps.numpy_to_vtk(arr.ravel(), deep=1, array_type=vtk.VTK_FLOAT).SetName("TEST")
-        self.inputVolume.SetAndObserveImageData(imageData)
+        # Create test volume data: a deterministic uint8 ramp, attached as the scalars
+        self.setInputScalars(np.arange(50 * 50 * 50).astype(np.uint8), vtk.VTK_UNSIGNED_CHAR)
         
         # Set up ROI 
         self.roi.SetCenter([25, 25, 25])
         self.roi.SetSize([30, 30, 30])
         
-        # Create widget and logic
+        # Create widget, and use its logic for the tests
         self.widget = CropTBVolumeWidget()
         self.widget.setup()
         self.logic = self.widget.logic
+        if not self.logic:
+            self.fail("Logic creation failed")
         
         # Connect ROI to widget before testing
         self.widget.ui.roiSelector.setCurrentNode(self.roi)
         slicer.app.processEvents()  # Allow UI to update
 
+    def setInputScalars(self, arr, vtkType):
+        """Replace the 50x50x50 test input's voxels with the flat array"""
+        imageData = vtk.vtkImageData()
+        imageData.SetDimensions(50, 50, 50)
+        # Share the NumPy buffer with VTK; the VTK array keeps it referenced
+        vtkArray = nps.numpy_to_vtk(arr, deep=False, array_type=vtkType)
+        vtkArray.SetName("TEST")
+        imageData.GetPointData().SetScalars(vtkArray)
+        self.inputVolume.SetAndObserveImageData(imageData)
+
     def tearDown(self):
         """Clean up after each test"""
         if hasattr(self, 'widget') and self.widget:
@@ -1288,7 +1683,9 @@ class CropTBVolumeTest(ScriptedLoadableModuleTest):
         self.setUp()
         try:
             self.test_VoxelBasedCropping()
+            self.test_VoxelBasedCroppingFloat()
             self.test_ROIInteraction()
+            self.test_VoxelBasedCroppingFullExtent()
         finally:
             self.tearDown()
 
@@ -1301,11 +1698,62 @@ class CropTBVolumeTest(ScriptedLoadableModuleTest):
         # Execute cropping
         self.logic.cropVolume()
         
-        # Verify output
+        # Verify output: ROI bounds 10..40 mm on the identity-geometry input
         self.assertIsNotNone(self.outputVolume.GetImageData())
         outputDims = self.outputVolume.GetImageData().GetDimensions()
-        self.assertTrue(all(d > 0 for d in outputDims))
-        print(f"Output dimensions: {outputDims}")
+        self.assertEqual(outputDims, (31, 31, 31))
+        self.assertCropMatchesInput([10, 40, 10, 40, 10, 40])
+        outputScalars = self.outputVolume.GetImageData().GetPointData().GetScalars()
+
+        # A crop of the same shape elsewhere overwrites the existing voxel buffer
+        self.roi.SetCenter([20, 22, 24])
+        self.logic.cropVolume()
+        self.assertTrue(self.outputVolume.GetImageData().GetPointData().GetScalars() is outputScalars)
+        self.assertCropMatchesInput([5, 35, 7, 37, 9, 39])
+
+    def assertCropMatchesInput(self, extent):
+        """Check the output voxels and origin against the input region [i0, i1, j0, j1, k0, k1]"""
+        i0, i1, j0, j1, k0, k1 = extent
+        expected = slicer.util.arrayFromVolume(self.inputVolume)[k0:k1+1, j0:j1+1, i0:i1+1]
+        np.testing.assert_array_equal(slicer.util.arrayFromVolume(self.outputVolume), expected)
+
+        inputIJKToRAS = vtk.vtkMatrix4x4()
+        self.inputVolume.GetIJKToRASMatrix(inputIJKToRAS)
+        expectedOrigin = inputIJKToRAS.MultiplyPoint((i0, j0, k0, 1))[:3]
+        outputIJKToRAS = vtk.vtkMatrix4x4()
+        self.outputVolume.GetIJKToRASMatrix(outputIJKToRAS)
+        outputOrigin = [outputIJKToRAS.GetElement(row, 3) for row in range(3)]
+        np.testing.assert_allclose(outputOrigin, expectedOrigin, atol=1e-6)
+
+    def test_VoxelBasedCroppingFloat(self):
+        """Cropping keeps floating point scalars unchanged"""
+        self.setInputScalars(np.arange(50 * 50 * 50, dtype=np.float32), vtk.VTK_FLOAT)
+        self.logic.parameterNode.inputVolume = self.inputVolume
+        self.logic.parameterNode.roiNode = self.roi
+        self.logic.parameterNode.outputVolume = self.outputVolume
+
+        self.logic.cropVolume()
+
+        outputScalars = self.outputVolume.GetImageData().GetPointData().GetScalars()
+        self.assertEqual(outputScalars.GetDataType(), vtk.VTK_FLOAT)
+
+    def test_VoxelBasedCroppingFullExtent(self):
+        """An ROI covering the whole input yields an independent copy of all its voxels"""
+        self.roi.SetCenter([25, 25, 25])
+        self.roi.SetSize([60, 60, 60])
+        self.logic.parameterNode.inputVolume = self.inputVolume
+        self.logic.parameterNode.roiNode = self.roi
+        self.logic.parameterNode.outputVolume = self.outputVolume
+
+        self.logic.cropVolume()
+
+        outputImage = self.outputVolume.GetImageData()
+        self.assertEqual(outputImage.GetDimensions(), (50, 50, 50))
+        self.assertCropMatchesInput([0, 49, 0, 49, 0, 49])
+        inputScalars = self.inputVolume.GetImageData().GetPointData().GetScalars()
+        self.assertFalse(outputImage.GetPointData().GetScalars() is inputScalars)
+        self.assertFalse(np.shares_memory(slicer.util.arrayFromVolume(self.outputVolume),
+                                          slicer.util.arrayFromVolume(self.inputVolume)))
 
     def test_ROIInteraction(self):
         """Test ROI modification updates UI correctly"""